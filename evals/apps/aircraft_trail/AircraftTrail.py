@@ -29,7 +29,7 @@ class AircraftTrail(Folder):
         new_pos.select(True)
         self.append(new_pos)
         while len(self) > self.trail_sz:
-            self.remove(self[0])
+            self.remove_at(0)
         self._description = description_builder(
             src={
                 'Transponder': data_point.transponder,
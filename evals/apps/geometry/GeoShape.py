@@ -183,5 +183,4 @@ class GeoShape(Placemark, ABC):
                 altitude_mode=altitude_mode,
             ),
         )
-        ABC.__init__(self)
         self.select(selected)
@@ -16,6 +16,8 @@ class GeoCoordinates:
     :var Optional[float] alt: The (optional) altitude, in metres.
     """
 
+    __slots__ = ('lon', 'lat', 'alt')
+
     def __init__(
         self,
         lon: float = 0,
@@ -1,7 +1,11 @@
 import enum
+from typing import IO, TYPE_CHECKING, Union
 
 from lxml import etree
 
+if TYPE_CHECKING:
+    from .KMLObjects.Object import Object
+
 
 KML_UPDATE_CONTAINER_LIMIT_DEFAULT: int = 100
 """The default maximum number of :class:`~pyLiveKML.KML.KMLObjects.Feature` objects that will be included in each 
@@ -14,19 +18,62 @@ kml_header: str = '<?xml version="1.0" encoding="UTF-8"?>'
 """
 
 
+kml_nsmap: dict[str, str] = {
+    'gx': 'http://www.google.com/kml/ext/2.2',
+    'kml': 'http://www.opengis.net/kml/2.2',
+    'atom': 'http://www.w3.org/2005/Atom',
+}
+"""The XML namespaces, keyed by prefix, that are declared by the opening <kml> tag of a KML document.
+"""
+
+
+_ns_cache: dict[str, str] = {}
+
+
+def with_ns(tag: str) -> str:
+    """Translate a namespace-prefixed tag, e.g. 'gx:altitudeOffset', into the Clark notation, e.g.
+    '{http://www.google.com/kml/ext/2.2}altitudeOffset', that lxml requires for namespaced tags. Tags without a prefix
+    are returned unchanged. Translations are memoized, so repeated lookups of the same tag are a single dict hit.
+
+    :param str tag: The tag to be translated, optionally prefixed by one of the namespace prefixes in
+        :attr:`kml_nsmap`.
+    :return: The translated tag.
+    :rtype: str
+    """
+    result = _ns_cache.get(tag)
+    if result is None:
+        prefix, sep, local = tag.partition(':')
+        result = f'{{{kml_nsmap[prefix]}}}{local}' if sep else tag
+        _ns_cache[tag] = result
+    return result
+
+
 def kml_tag() -> etree.Element:
     """Construct the opening <kml> tag, with namespaces, for a KML document.
 
     :return: The <kml> tag, with namespaces, that encloses the contents of a KML document.
     :rtype: etree.Element
     """
-    nsmap = {
-        'gx': 'http://www.google.com/kml/ext/2.2',
-        'kml': 'http://www.opengis.net/kml/2.2',
-        'atom': 'http://www.w3.org/2005/Atom',
-    }
-    attrib = {'xmlns': 'http://www.opengis.net/kml/2.2'}
-    return etree.Element('kml', nsmap=nsmap, attrib=attrib)
+    attrib = {'xmlns': kml_nsmap['kml']}
+    return etree.Element('kml', nsmap=kml_nsmap, attrib=attrib)
+
+
+def write_kml(file: Union[str, IO[bytes]], root: 'Object'):
+    """Write a complete KML document, rooted at an :class:`~pyLiveKML.KML.KMLObjects.Object`, to a file or file-like
+    object using an incremental etree.xmlfile writer. Because the KML of a
+    :class:`~pyLiveKML.KML.KMLObjects.Container` is streamed one enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` at
+    a time, the whole element tree is never held in memory at once. Prefer this over
+    :func:`~pyLiveKML.KML.KMLObjects.Container.Container.construct_kml` and etree.tostring() when emitting large
+    documents.
+
+    :param Union[str, IO[bytes]] file: The file name, or binary file-like object, that the KML document will be written to.
+    :param Object root: The :class:`~pyLiveKML.KML.KMLObjects.Object` to be enclosed by the <kml> tag, typically a
+        :class:`~pyLiveKML.KML.KMLObjects.Container`.
+    """
+    with etree.xmlfile(file, encoding='UTF-8') as xf:
+        xf.write_declaration()
+        with xf.element('kml', nsmap=kml_nsmap, attrib={'xmlns': kml_nsmap['kml']}):
+            root.write_kml(xf)
 
 
 class AltitudeMode(enum.Enum):
@@ -44,7 +91,7 @@ class ColorMode(enum.Enum):
     :class:`~pyLiveKML.KML.KMLObjects.ColorStyle`. Refer to the KML documentation at
     https://developers.google.com/kml/documentation/kmlreference#kml-fields.
     """
-    NORMAL = 'normal',
+    NORMAL = 'normal'
     RANDOM = 'random'
 
 
@@ -73,9 +73,9 @@ class BalloonStyle(SubStyle):
 
     def build_kml(self, root: etree.Element, with_children=True):
         if self._bg_color is not None:
-            etree.SubElement(root, 'bgColor').text = f'{self.bg_color:08x}'
+            etree.SubElement(root, 'bgColor').text = f'{self._bg_color:08x}'
         if self._text_color is not None:
-            etree.SubElement(root, 'textColor').text = f'{self.text_color:08x}'
+            etree.SubElement(root, 'textColor').text = f'{self._text_color:08x}'
         if self._text is not None:
             etree.SubElement(root, 'text').text = self._text
         if self._display_mode is not None:
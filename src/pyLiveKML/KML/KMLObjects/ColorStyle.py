@@ -1,11 +1,10 @@
-from abc import ABC
 from typing import Optional
 
 from ..KML import ColorMode
 from .SubStyle import SubStyle
 
 
-class ColorStyle(SubStyle, ABC):
+class ColorStyle(SubStyle):
     """A KML 'ColorStyle', per https://developers.google.com/kml/documentation/kmlreference#colorstyle.  The
     ColorStyle is the abstract base class for a subset of the specific sub-styles that are optionally included
     in :class:`~pyLiveKML.KML.KMLObjects.Style` objects, and that act to apply a color, typically (but not exclusively)
@@ -52,7 +51,6 @@ class ColorStyle(SubStyle, ABC):
             color_mode: Optional[ColorMode] = None
     ):
         SubStyle.__init__(self)
-        ABC.__init__(self)
         self._color = None
         self.color = color
         self._color_mode = color_mode
@@ -1,15 +1,15 @@
-from abc import ABC
+from collections import deque
 from typing import Optional, Iterable, NamedTuple, Iterator
 
 from lxml import etree
 
-from ..KML import KML_UPDATE_CONTAINER_LIMIT_DEFAULT, State
+from ..KML import KML_UPDATE_CONTAINER_LIMIT_DEFAULT, kml_nsmap
 from .Feature import Feature
-from .Object import Object, ObjectChild
+from .Object import Object, ObjectChild, _DELETE_STATES
 from .StyleSelector import StyleSelector
 
 
-class Container(list[Feature], Feature, ABC):
+class Container(list[Feature], Feature):
     """A KML 'Container', per https://developers.google.com/kml/documentation/kmlreference#container. Note that while
     Containers are explicitly abstract, :class:`~pyLiveKML.KML.KMLObjects.Container` is the base class for KML
     :class:`~pyLiveKML.KML.KMLObjects.Folder` and :class:`~pyLiveKML.KML.KMLObjects.Document` that have an "existence"
@@ -36,35 +36,35 @@ class Container(list[Feature], Feature, ABC):
         objects to be enclosed by this :class:`~pyLiveKML.KML.KMLObjects.Container`.
     """
 
+    _is_container: bool = True
+
     @property
-    def containers(self) -> Iterator['ContainedFeature']:
-        """A generator to retrieve references to any :class:`~pyLiveKML.KML.KMLObjects.Container` objects that are
-        enclosed by this :class:`~pyLiveKML.KML.KMLObjects.Container` object, and the tree that is rooted at it.
+    def containers(self) -> tuple['ContainedFeature', ...]:
+        """References to any :class:`~pyLiveKML.KML.KMLObjects.Container` objects that are enclosed by this
+        :class:`~pyLiveKML.KML.KMLObjects.Container` object, and the tree that is rooted at it. The tuple is built once
+        and reused until the tree is modified.
 
-        :returns: A generator of :class:`~pyLiveKML.KML.KMLObjects.Container.ContainedFeature` named tuples that
-            describe each enclosed :class:`~pyLiveKML.KML.KMLObjects.Container` as a (container, feature)
+        :returns: A tuple of :class:`~pyLiveKML.KML.KMLObjects.Container.ContainedFeature` named tuples that describe
+            each enclosed :class:`~pyLiveKML.KML.KMLObjects.Container` as a (container, feature)
         """
-        for f in self:
-            if isinstance(f, Container):
-                yield ContainedFeature(container=self, feature=f)
-                yield from f.containers
+        if self._containers_cache is None:
+            self._build_caches()
+        return self._containers_cache
 
     @property
-    def features(self) -> Iterator['ContainedFeature']:
-        """A generator to retrieve references to the :class:`~pyLiveKML.KML.KMLObjects.Feature` objects that are
-        enclosed by this :class:`~pyLiveKML.KML.KMLObjects.Container` object, and the tree that is rooted at it. Note
-        that :class:`~pyLiveKML.KML.KMLObjects.Container` objects are *not* yielded by this generator, despite being
-        specializations of :class:`~pyLiveKML.KML.KMLObjects.Feature`; use the :attr:`containers` property to retrieve
-        them.
+    def features(self) -> tuple['ContainedFeature', ...]:
+        """References to the :class:`~pyLiveKML.KML.KMLObjects.Feature` objects that are enclosed by this
+        :class:`~pyLiveKML.KML.KMLObjects.Container` object, and the tree that is rooted at it. Note that
+        :class:`~pyLiveKML.KML.KMLObjects.Container` objects are *not* included, despite being specializations of
+        :class:`~pyLiveKML.KML.KMLObjects.Feature`; use the :attr:`containers` property to retrieve them. The tuple is
+        built once and reused until the tree is modified.
 
-        :returns: A generator of :class:`~pyLiveKML.KML.KMLObjects.Container.ContainedFeature` named tuples that
-            describes each enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` as a (container, feature)
+        :returns: A tuple of :class:`~pyLiveKML.KML.KMLObjects.Container.ContainedFeature` named tuples that describe
+            each enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` as a (container, feature)
         """
-        for f in self:
-            if isinstance(f, Container):
-                yield from f.features
-            elif isinstance(f, Feature):
-                yield ContainedFeature(container=self, feature=f)
+        if self._features_cache is None:
+            self._build_caches()
+        return self._features_cache
 
     @property
     def children(self) -> Iterator[ObjectChild]:
@@ -113,10 +113,8 @@ class Container(list[Feature], Feature, ABC):
 
         :returns: A generator of :class:`~pyLiveKML.KML.KMLObjects.Feature` objects.
         """
-        while len(self.__deleted) > 0:
-            f = self.__deleted[0]
-            self.__deleted.remove(f)
-            yield f
+        while self.__deleted:
+            yield self.__deleted.popleft()
 
     def construct_kml(self, with_features: bool = False) -> etree.Element:
         """Overridden from :func:`~pyLiveKML.KML.KMLObjects.Object.construct_kml` to allow for the creation of
@@ -125,32 +123,141 @@ class Container(list[Feature], Feature, ABC):
         """
         root = Object.construct_kml(self)
         if with_features:
-            for f in self:
-                if isinstance(f, Container):
-                    root.append(f.construct_kml(with_features=True))
-                elif isinstance(f, Feature):
-                    root.append(f.construct_kml())
+            self._populate_features(root)
         return root
 
+    def populate_kml(self, parent: etree.Element, with_features: bool = False) -> etree.Element:
+        """Overridden from :func:`~pyLiveKML.KML.KMLObjects.Object.populate_kml` to allow for the creation of
+        contained or enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` instances, including other
+        :class:`~pyLiveKML.KML.KMLObjects.Container` instances.
+        """
+        if with_features:
+            return self._populate_kml_deep(parent)
+        return Object.populate_kml(self, parent)
+
+    def _populate_kml_deep(self, parent: etree.Element) -> etree.Element:
+        """Construct the KML representation of this :class:`~pyLiveKML.KML.KMLObjects.Container` and of the whole tree
+        of :class:`~pyLiveKML.KML.KMLObjects.Feature` instances that it encloses, as a child of the provided parent
+        etree.Element. The with_features decision is made once, at the root of the tree, rather than at every level.
+        """
+        root = Object.populate_kml(self, parent)
+        self._populate_features(root)
+        return root
+
+    def _populate_features(self, root: etree.Element):
+        """Construct the KML representations of the :class:`~pyLiveKML.KML.KMLObjects.Feature` instances enclosed by
+        this :class:`~pyLiveKML.KML.KMLObjects.Container`, including their own enclosed trees, as children of the
+        provided root etree.Element.
+        """
+        for f in self:
+            if f._is_container:
+                f._populate_kml_deep(root)
+            else:
+                f.populate_kml(root)
+
+    def write_kml(self, xf: etree.xmlfile, with_features: bool = True):
+        """Overridden from :func:`~pyLiveKML.KML.KMLObjects.Object.Object.write_kml` to stream the enclosed
+        :class:`~pyLiveKML.KML.KMLObjects.Feature` instances one at a time, so that only the KML of a single enclosed
+        :class:`~pyLiveKML.KML.KMLObjects.Feature` is held in memory at any time.
+
+        :param etree.xmlfile xf: The writer that will be written to.
+        :param bool with_features: True if the enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` instances should
+            be written, else False.
+        """
+        # as for Object.write_kml(), the header is built under a scratch parent that declares the KML namespaces
+        root = Object.populate_kml(self, etree.Element('kml', nsmap=kml_nsmap))
+        with xf.element(root.tag, attrib=root.attrib):
+            for e in list(root):
+                root.remove(e)
+                xf.write(e)
+            if with_features:
+                for f in self:
+                    f.write_kml(xf)
+
     def build_kml(self, root: etree.Element, with_children=True):
-        if self.name is not None:
-            etree.SubElement(root, 'name').text = self.name
-        if self.visibility is not None:
-            etree.SubElement(root, 'visibility').text = str(int(self.visibility))
-        if self.is_open is not None:
-            etree.SubElement(root, 'open').text = str(int(self.is_open))
-        if self.description is not None:
-            etree.SubElement(root, 'description').text = self.description
+        if self._name is not None:
+            etree.SubElement(root, 'name').text = self._name
+        if self._visibility is not None:
+            etree.SubElement(root, 'visibility').text = '1' if self._visibility else '0'
+        if self._is_open is not None:
+            etree.SubElement(root, 'open').text = '1' if self._is_open else '0'
+        if self._description is not None:
+            etree.SubElement(root, 'description').text = self._description
         if with_children:
             for s in self._styles:
-                root.append(s.construct_kml())
+                s.populate_kml(root)
+
+    def _walk(self) -> Iterator['ContainedFeature']:
+        """Walk the tree of :class:`~pyLiveKML.KML.KMLObjects.Feature` instances that is rooted at this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`, in document order, using an explicit stack rather than recursion.
+
+        :returns: A generator of :class:`~pyLiveKML.KML.KMLObjects.Container.ContainedFeature` named tuples.
+        """
+        stack = [(self, iter(self))]
+        while stack:
+            container, it = stack[-1]
+            for f in it:
+                yield ContainedFeature(container=container, feature=f)
+                if f._is_container:
+                    stack.append((f, iter(f)))
+                    break
+            else:
+                stack.pop()
+
+    def _build_caches(self):
+        """Flatten the tree rooted at this :class:`~pyLiveKML.KML.KMLObjects.Container` into the tuples that are
+        retrieved by the :attr:`containers` and :attr:`features` properties.
+        """
+        containers: list[ContainedFeature] = []
+        features: list[ContainedFeature] = []
+        for cf in self._walk():
+            if cf.feature._is_container:
+                containers.append(cf)
+            else:
+                features.append(cf)
+        self._containers_cache = tuple(containers)
+        self._features_cache = tuple(features)
+
+    def _invalidate_caches(self):
+        """Discard the flattened trees of this :class:`~pyLiveKML.KML.KMLObjects.Container` and of every
+        :class:`~pyLiveKML.KML.KMLObjects.Container` that encloses it, because the tree has been modified.
+        """
+        c = self
+        while c is not None:
+            c._containers_cache = None
+            c._features_cache = None
+            c = c._container
 
     def append(self, item: Feature):
         """Append a :class:`~pyLiveKML.KML.KMLObjects.Feature` to this :class:`~pyLiveKML.KML.KMLObjects.Container`.
 
         :param Feature item: The :class:`~pyLiveKML.KML.KMLObjects.Feature` to be appended.
         """
-        list[Feature].append(self, item)
+        list.append(self, item)
+        # invalidate before setting the container, which raises if the Feature is already enclosed elsewhere
+        self._invalidate_caches()
+        item.container = self
+
+    def extend(self, items: Iterable[Feature]):
+        """Append each of an iterable of :class:`~pyLiveKML.KML.KMLObjects.Feature` instances to this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`.
+
+        :param Iterable[Feature] items: The :class:`~pyLiveKML.KML.KMLObjects.Feature` instances to be appended.
+        """
+        items = list(items)
+        list.extend(self, items)
+        self._invalidate_caches()
+        for item in items:
+            item.container = self
+
+    def insert(self, index: int, item: Feature):
+        """Insert a :class:`~pyLiveKML.KML.KMLObjects.Feature` into this :class:`~pyLiveKML.KML.KMLObjects.Container`.
+
+        :param int index: The position at which the :class:`~pyLiveKML.KML.KMLObjects.Feature` will be inserted.
+        :param Feature item: The :class:`~pyLiveKML.KML.KMLObjects.Feature` to be inserted.
+        """
+        list.insert(self, index, item)
+        self._invalidate_caches()
         item.container = self
 
     def remove(self, __value: Feature) -> None:
@@ -158,11 +265,87 @@ class Container(list[Feature], Feature, ABC):
         Of course, the :class:`~pyLiveKML.KML.KMLObjects.Feature` must be enclosed in this
         :class:`~pyLiveKML.KML.KMLObjects.Container` to be able to be removed.
 
+        :note: The :class:`~pyLiveKML.KML.KMLObjects.Feature` is located by a linear search. If its position is already
+            known, :func:`remove_at` avoids the search.
+
         :param Feature __value: The :class:`~pyLiveKML.KML.KMLObjects.Feature` to be removed.
         """
         if __value.selected:
             self.__deleted.append(__value)
-        list[Feature].remove(self, __value)
+        list.remove(self, __value)
+        self._invalidate_caches()
+
+    def remove_at(self, idx: int) -> None:
+        """Remove the :class:`~pyLiveKML.KML.KMLObjects.Feature` at a known position from this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`, with the same synchronization behaviour as :func:`remove` but
+        without searching for it.
+
+        :param int idx: The position of the :class:`~pyLiveKML.KML.KMLObjects.Feature` to be removed.
+        """
+        f = list.pop(self, idx)
+        if f.selected:
+            self.__deleted.append(f)
+        self._invalidate_caches()
+
+    def pop(self, __index: int = -1) -> Feature:
+        """Remove and return the :class:`~pyLiveKML.KML.KMLObjects.Feature` at a position in this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`.
+
+        :param int __index: The position of the :class:`~pyLiveKML.KML.KMLObjects.Feature`; defaults to the last.
+        :returns: The removed :class:`~pyLiveKML.KML.KMLObjects.Feature`.
+        """
+        f = list.pop(self, __index)
+        self._invalidate_caches()
+        return f
+
+    def clear(self):
+        """Remove all :class:`~pyLiveKML.KML.KMLObjects.Feature` instances from this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`.
+        """
+        list.clear(self)
+        self._invalidate_caches()
+
+    def sort(self, *args, **kwargs):
+        """Sort the enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` instances in place, as per list.sort().
+        """
+        list.sort(self, *args, **kwargs)
+        self._invalidate_caches()
+
+    def reverse(self):
+        """Reverse the order of the enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` instances in place.
+        """
+        list.reverse(self)
+        self._invalidate_caches()
+
+    def __setitem__(self, key, value):
+        """Replace the :class:`~pyLiveKML.KML.KMLObjects.Feature` (or slice of them) at a position in this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`.
+        """
+        items = list(value) if isinstance(key, slice) else [value]
+        list.__setitem__(self, key, items if isinstance(key, slice) else value)
+        self._invalidate_caches()
+        for f in items:
+            f.container = self
+
+    def __delitem__(self, key):
+        """Delete the :class:`~pyLiveKML.KML.KMLObjects.Feature` (or slice of them) at a position in this
+        :class:`~pyLiveKML.KML.KMLObjects.Container`.
+        """
+        list.__delitem__(self, key)
+        self._invalidate_caches()
+
+    def __iadd__(self, other: Iterable[Feature]):
+        """Append each of an iterable of :class:`~pyLiveKML.KML.KMLObjects.Feature` instances, as per :func:`extend`.
+        """
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: int):
+        """Repeat the enclosed :class:`~pyLiveKML.KML.KMLObjects.Feature` instances in place, as per list.__imul__().
+        """
+        list.__imul__(self, n)
+        self._invalidate_caches()
+        return self
 
     def force_idle(self, cascade: bool = False):
         """Overridden from :func:`~pyLiveKML.KML.KMLObjects.Object.Object.force_idle` to enable the entire tree of
@@ -179,12 +362,9 @@ class Container(list[Feature], Feature, ABC):
         :class:`~pyLiveKML.KML.KMLObjects.Container`) instances to be forced to the IDLE state. Typically called as a
         result of the target :class:`~pyLiveKML.KML.KMLObjects.Container` being deleted from GEP.
         """
-        for f in self:
-            if isinstance(f, Container):
-                # note the implication from force_idle() that cascade is _always_ true for force_features_idle
-                f.force_idle(True)
-            elif isinstance(f, Feature):
-                f.force_idle()
+        # the walk already reaches every enclosed Feature, so each one is forced idle without cascading
+        for cf in self._walk():
+            cf.feature.force_idle()
 
     def select(self, value: bool, cascade: bool = False):
         """Overrides :func:`~pyLiveKML.KML.KMLObjects.Feature.Feature.select` to implement select/deselect cascade to
@@ -194,9 +374,9 @@ class Container(list[Feature], Feature, ABC):
         """
         Feature.select(self, value, cascade)
         if cascade:
-            for f in self:
-                f.select(value, True)
-        if self._state == State.DELETE_CREATED or self._state == State.DELETE_CHANGED:
+            for cf in self._walk():
+                cf.feature.select(value, False)
+        if self._state in _DELETE_STATES:
             self.__deleted.clear()
             self.force_features_idle()
 
@@ -210,7 +390,7 @@ class Container(list[Feature], Feature, ABC):
             styles: Optional[Iterable[StyleSelector]] = None,
             features: Optional[Iterable[Feature]] = None,
     ):
-        list[Feature].__init__(self)
+        list.__init__(self)
         Feature.__init__(
             self,
             name=name,
@@ -218,19 +398,20 @@ class Container(list[Feature], Feature, ABC):
             style_url=style_url,
             styles=styles
         )
-        ABC.__init__(self)
+        self._containers_cache: Optional[tuple[ContainedFeature, ...]] = None
+        self._features_cache: Optional[tuple[ContainedFeature, ...]] = None
         if features:
             self.extend(features)
         self._is_open = is_open
         self._update_limit = KML_UPDATE_CONTAINER_LIMIT_DEFAULT
         self.update_limit = update_limit
-        self.__deleted = list[Feature]()
+        self.__deleted: deque[Feature] = deque()
 
     def __str__(self):
         return Feature.__str__(self)
 
     def __repr__(self):
-        return Feature.__repr__(self)
+        return self.__str__()
 
 
 ContainedFeature = NamedTuple('ContainedFeature', [('container', Container), ('feature', Feature)])
@@ -1,12 +1,15 @@
-from abc import ABC
-from typing import Optional, Iterable, Iterator
+from typing import Optional, Iterable
 
 from ..KML import State
 from ..KMLObjects.Object import Object
 from ..KMLObjects.StyleSelector import StyleSelector
 
 
-class Feature(Object, ABC):
+# the states in which a Feature is not yet visible in GEP, and so may be moved to a different container
+_UNSYNCED_STATES = (State.IDLE, State.CREATING)
+
+
+class Feature(Object):
     """A KML 'Feature', per https://developers.google.com/kml/documentation/kmlreference#feature. Note that while
     Features are explicitly abstract in the KML specification, :class:`~pyLiveKML.KML.KMLObjects.Feature` is the base
     class for KML :class:`~pyLiveKML.KML.KMLObjects.Object` instances that have an "existence" in GEP, i.e. that are
@@ -28,6 +31,10 @@ class Feature(Object, ABC):
         objects that are local to this :class:`~pyLiveKML.KML.KMLObjects.Feature`.
     """
 
+    # type tag, overridden by Container, so that tree traversals can branch on a plain attribute load rather than an
+    # isinstance() check against an ABCMeta class
+    _is_container: bool = False
+
     @property
     def container(self) -> Optional['Container']:
         """The :class:`~pyLiveKML.KML.KMLObjects.Container` that immediately encloses this
@@ -41,7 +48,7 @@ class Feature(Object, ABC):
 
     @container.setter
     def container(self, value: 'Container'):
-        if self._state == State.IDLE or self._state == State.CREATING:
+        if self._state in _UNSYNCED_STATES:
             self._container = value
         else:
             raise ValueError('If a Feature is visible in GEP, you cannot change its\' \'container\' property.')
@@ -88,15 +95,13 @@ class Feature(Object, ABC):
             self.field_changed()
 
     @property
-    def styles(self) -> Iterator[StyleSelector]:
-        """A generator to retrieve references to any :class:`~pyLiveKML.KML.KMLObjects.Style` or
-        :class:`~pyLiveKML.KML.KMLObjects.StyleMap` objects that are children of this
-        :class:`~pyLiveKML.KML.KMLObjects.Feature`.
+    def styles(self) -> tuple[StyleSelector, ...]:
+        """References to any :class:`~pyLiveKML.KML.KMLObjects.Style` or :class:`~pyLiveKML.KML.KMLObjects.StyleMap`
+        objects that are children of this :class:`~pyLiveKML.KML.KMLObjects.Feature`.
 
-        :returns: A generator of :class:`~pyLiveKML.KML.KMLObjects.StyleSelector` objects.
+        :returns: A tuple of :class:`~pyLiveKML.KML.KMLObjects.StyleSelector` objects.
         """
-        for s in self._styles:
-            yield s
+        return self._styles
 
     # override Object.select() to enable upwards cascade, i.e. if a Feature contained in an unselected parent Feature
     # is selected, the parent Feature must also be selected in order for GEP synchronization to work correctly.
@@ -121,18 +126,15 @@ class Feature(Object, ABC):
             styles: Optional[Iterable[StyleSelector]] = None,
     ):
         Object.__init__(self)
-        ABC.__init__(self)
         self._container = container
         self._name = name
         self._visibility = visibility
         self._description = description
         self._style_url = style_url
-        self._styles = list[StyleSelector]()
-        if styles:
-            self._styles.extend(styles)
+        self._styles: tuple[StyleSelector, ...] = tuple(styles) if styles else ()
 
     def __str__(self):
-        return f'{self.kml_type}:{self.name}'
+        return f'{self.kml_type}:{self._name}'
 
     def __repr__(self):
         return self.__str__()
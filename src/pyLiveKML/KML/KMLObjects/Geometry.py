@@ -1,9 +1,7 @@
-from abc import ABC
-
 from .Object import Object
 
 
-class Geometry(Object, ABC):
+class Geometry(Object):
     """A KML 'Geometry', per https://developers.google.com/kml/documentation/kmlreference#geometry. The
     :class:`~pyLiveKML.KML.KMLObjects.Geometry` class is the abstract base class for KML
     :class:`~pyLiveKML.KML.KMLObjects.Object` instances that have an existence as geospatial objects in GEP and that
@@ -11,4 +9,3 @@ class Geometry(Object, ABC):
     """
     def __init__(self):
         Object.__init__(self)
-        ABC.__init__(self)
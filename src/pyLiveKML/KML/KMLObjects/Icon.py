@@ -2,13 +2,19 @@ from typing import Optional, NamedTuple
 
 from lxml import etree
 
-from ..KML import RefreshMode
+from ..KML import RefreshMode, with_ns
 from .Link import Link
 
 
 GxParams = NamedTuple('GxParams', [('x', int), ('y', int), ('w', int), ('h', int)])
 
 
+_GX_X = with_ns('gx:x')
+_GX_Y = with_ns('gx:y')
+_GX_W = with_ns('gx:w')
+_GX_H = with_ns('gx:h')
+
+
 class Icon(Link):
     """A KML 'Icon', per https://developers.google.com/kml/documentation/kmlreference#icon.
     :class:`~pyLiveKML.KML.KMLObjects.Icon` instances are used to specify an image file that will be displayed in a GEP
@@ -47,13 +53,13 @@ class Icon(Link):
             etree.SubElement(root, 'href').text = self._href
         if self._gx_params:
             if self._gx_params.x != 0:
-                etree.SubElement(root, 'gx:x').text = str(self._gx_params.x)
+                etree.SubElement(root, _GX_X).text = str(self._gx_params.x)
             if self._gx_params.y != 0:
-                etree.SubElement(root, 'gx:y').text = str(self._gx_params.y)
+                etree.SubElement(root, _GX_Y).text = str(self._gx_params.y)
             if self._gx_params.w != -1:
-                etree.SubElement(root, 'gx:w').text = str(self._gx_params.w)
+                etree.SubElement(root, _GX_W).text = str(self._gx_params.w)
             if self._gx_params.h != -1:
-                etree.SubElement(root, 'gx:h').text = str(self._gx_params.h)
+                etree.SubElement(root, _GX_H).text = str(self._gx_params.h)
         if self._refresh_mode is not None:
             etree.SubElement(root, 'refreshMode').text = self._refresh_mode.value
         if self._refresh_interval is not None:
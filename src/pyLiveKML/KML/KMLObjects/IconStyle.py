@@ -2,7 +2,7 @@ from typing import Optional
 
 from lxml import etree
 
-from ..KML import ColorMode
+from ..KML import ColorMode, Vec2Type
 from .ColorStyle import ColorStyle
 from ..Vec2 import Vec2
 
@@ -71,24 +71,33 @@ class IconStyle(ColorStyle):
 
     @hotspot.setter
     def hotspot(self, value: Optional[Vec2]):
-        value.name = 'hotSpot'
+        if value is not None:
+            value.vec_type = Vec2Type.HOTSPOT
         if self._hotspot != value:
             self._hotspot = value
             self.field_changed()
 
     def build_kml(self, root: etree.Element, with_children=True):
-        if self.color is not None:
-            etree.SubElement(root, 'color').text = f'{self.color:08x}'
-        if self.color_mode is not None:
-            etree.SubElement(root, 'colorMode').text = self.color_mode.value
-        if self.scale is not None:
-            etree.SubElement(root, 'scale').text = f'{self.scale:0.3f}'
-        if self.heading is not None:
-            etree.SubElement(root, 'heading').text = f'{self.heading:0.1f}'
-        if self.icon is not None:
-            etree.SubElement(etree.SubElement(root, 'Icon'), 'href').text = self.icon
-        if self.hotspot is not None:
-            root.append(self.hotspot.xml)
+        if self._color is not None:
+            etree.SubElement(root, 'color').text = f'{self._color:08x}'
+        if self._color_mode is not None:
+            etree.SubElement(root, 'colorMode').text = self._color_mode.value
+        if self._scale is not None:
+            etree.SubElement(root, 'scale').text = f'{self._scale:0.3f}'
+        if self._heading is not None:
+            etree.SubElement(root, 'heading').text = f'{self._heading:0.1f}'
+        if self._icon is not None:
+            etree.SubElement(etree.SubElement(root, 'Icon'), 'href').text = self._icon
+        if self._hotspot is not None:
+            root.append(self._hotspot.xml)
+
+    def _build_key(self) -> tuple:
+        # the hotspot is a mutable Vec2 whose fields may be changed in place without calling field_changed(), so its
+        # field values must form part of the key for the memoized KML
+        key = ColorStyle._build_key(self)
+        if self._hotspot is None:
+            return key
+        return (*key, Vec2._fields(self._hotspot))
 
     def __init__(
             self,
@@ -36,12 +36,12 @@ class LabelStyle(ColorStyle):
             self.field_changed()
 
     def build_kml(self, root: etree.Element, with_children=True):
-        if self.color is not None:
-            etree.SubElement(root, 'color').text = f'{self.color:08x}'
-        if self.color_mode is not None:
-            etree.SubElement(root, 'colorMode').text = self.color_mode.value
-        if self.scale is not None:
-            etree.SubElement(root, 'scale').text = f'{self.scale:0.3f}'
+        if self._color is not None:
+            etree.SubElement(root, 'color').text = f'{self._color:08x}'
+        if self._color_mode is not None:
+            etree.SubElement(root, 'colorMode').text = self._color_mode.value
+        if self._scale is not None:
+            etree.SubElement(root, 'scale').text = f'{self._scale:0.3f}'
 
     def __init__(
             self,
@@ -1,12 +1,16 @@
-from typing import Optional, Iterable, Iterator
+from typing import Optional, Iterable
 
 from lxml import etree
 
 from ..GeoCoordinates import GeoCoordinates
-from ..KML import AltitudeMode
+from ..KML import AltitudeMode, with_ns
 from .Geometry import Geometry
 
 
+_GX_ALTITUDE_OFFSET = with_ns('gx:altitudeOffset')
+_GX_DRAW_ORDER = with_ns('gx:drawOrder')
+
+
 class LineString(Geometry):
     """A LineString geometry, as per https://developers.google.com/kml/documentation/kmlreference#linestring.
     :class:`~pyLiveKML.KML.KMLObjects.LineString` objects define an open sequence of points, or
@@ -104,33 +108,32 @@ class LineString(Geometry):
             self.field_changed()
 
     @property
-    def coordinates(self) -> Iterator[GeoCoordinates]:
-        """A generator to retrieve the :class:`~pyLiveKML.KML.GeoCoordinates` objects that define this
+    def coordinates(self) -> tuple[GeoCoordinates, ...]:
+        """The :class:`~pyLiveKML.KML.GeoCoordinates` objects that define this
         :class:`~pyLiveKML.KML.KMLObjects.LineString` object.
 
-        :returns: A generator of :class:`~pyLiveKML.KML.GeoCoordinates` objects.
+        :returns: A tuple of :class:`~pyLiveKML.KML.GeoCoordinates` objects.
         """
-        yield from self._coordinates
+        return self._coordinates
 
     @coordinates.setter
     def coordinates(self, value: Iterable[GeoCoordinates]):
-        self._coordinates.clear()
-        self._coordinates.extend(value)
+        self._coordinates = tuple(value)
         self.field_changed()
 
     def build_kml(self, root: etree.Element, with_children=True):
         if self._gx_altitude_offset is not None:
-            etree.SubElement(root, 'gx:altitudeOffset').text = f'{self._gx_altitude_offset:0.1f}'
+            etree.SubElement(root, _GX_ALTITUDE_OFFSET).text = f'{self._gx_altitude_offset:0.1f}'
         if self._extrude is not None:
-            etree.SubElement(root, 'extrude').text = str(int(self._extrude))
+            etree.SubElement(root, 'extrude').text = '1' if self._extrude else '0'
         if self._tessellate is not None:
-            etree.SubElement(root, 'tessellate').text = str(int(self._tessellate))
+            etree.SubElement(root, 'tessellate').text = '1' if self._tessellate else '0'
         if self._altitude_mode is not None:
             etree.SubElement(root, 'altitudeMode').text = self._altitude_mode.value
         if self._gx_draw_order is not None:
-            etree.SubElement(root, 'gx:drawOrder').text = str(self._gx_draw_order)
+            etree.SubElement(root, _GX_DRAW_ORDER).text = str(self._gx_draw_order)
         if self._coordinates:
-            etree.SubElement(root, 'coordinates').text = ' '.join(c.__str__() for c in self._coordinates)
+            etree.SubElement(root, 'coordinates').text = ' '.join([c.__str__() for c in self._coordinates])
 
     def __init__(
             self,
@@ -147,5 +150,4 @@ class LineString(Geometry):
         self._tessellate = tessellate
         self._altitude_mode = altitude_mode
         self._gx_draw_order = gx_draw_order
-        self._coordinates = list[GeoCoordinates]()
-        self._coordinates.extend(coordinates)
+        self._coordinates: tuple[GeoCoordinates, ...] = tuple(coordinates)
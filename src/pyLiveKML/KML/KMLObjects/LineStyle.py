@@ -2,9 +2,16 @@ from typing import Optional
 
 from lxml import etree
 
+from ..KML import with_ns
 from .ColorStyle import ColorStyle
 
 
+_GX_OUTER_COLOR = with_ns('gx:outerColor')
+_GX_OUTER_WIDTH = with_ns('gx:outerWidth')
+_GX_PHYSICAL_WIDTH = with_ns('gx:physicalWidth')
+_GX_LABEL_VISIBILITY = with_ns('gx:labelVisibility')
+
+
 class LineStyle(ColorStyle):
     """
     A KML 'LineStyle', per https://developers.google.com/kml/documentation/kmlreference#linestyle.  Specifies
@@ -95,13 +102,13 @@ class LineStyle(ColorStyle):
         if self._width is not None:
             etree.SubElement(root, 'width').text = f'{self._width:0.1f}'
         if self._gx_outer_color is not None:
-            etree.SubElement(root, 'gx:outerColor').text = f'{self._gx_outer_color:08x}'
+            etree.SubElement(root, _GX_OUTER_COLOR).text = f'{self._gx_outer_color:08x}'
         if self._gx_outer_width is not None:
-            etree.SubElement(root, 'gx:outerWidth').text = f'{self._gx_outer_width:0.1f}'
+            etree.SubElement(root, _GX_OUTER_WIDTH).text = f'{self._gx_outer_width:0.1f}'
         if self._gx_physical_width is not None:
-            etree.SubElement(root, 'gx:physicalWidth').text = f'{self._gx_physical_width:0.1f}'
+            etree.SubElement(root, _GX_PHYSICAL_WIDTH).text = f'{self._gx_physical_width:0.1f}'
         if self._gx_label_visibility is not None:
-            etree.SubElement(root, 'gx:labelVisibility').text = str(int(self._gx_label_visibility))
+            etree.SubElement(root, _GX_LABEL_VISIBILITY).text = '1' if self._gx_label_visibility else '0'
 
     def __init__(
             self,
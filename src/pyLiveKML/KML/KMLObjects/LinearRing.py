@@ -1,12 +1,15 @@
-from typing import Optional, Iterable, Iterator
+from typing import Optional, Iterable
 
 from lxml import etree
 
 from ..GeoCoordinates import GeoCoordinates
-from ..KML import AltitudeMode
+from ..KML import AltitudeMode, with_ns
 from .Geometry import Geometry
 
 
+_GX_ALTITUDE_OFFSET = with_ns('gx:altitudeOffset')
+
+
 class LinearRing(Geometry):
     """A LinearRing geometry, as per https://developers.google.com/kml/documentation/kmlreference#linearring.
     :class:`~pyLiveKML.KML.KMLObjects.LinearRing` objects describe a geospatial boundary that is defined by a closed
@@ -91,37 +94,36 @@ class LinearRing(Geometry):
             self.field_changed()
 
     @property
-    def coordinates(self) -> Iterator[GeoCoordinates]:
-        """A generator to retrieve the :class:`~pyLiveKML.KML.GeoCoordinates` objects that define the boundary of the
+    def coordinates(self) -> tuple[GeoCoordinates, ...]:
+        """The :class:`~pyLiveKML.KML.GeoCoordinates` objects that define the boundary of the
         :class:`~pyLiveKML.KML.KMLObjects.LinearRing` object.
 
-        :returns: A generator of :class:`~pyLiveKML.KML.GeoCoordinates` objects.
+        :returns: A tuple of :class:`~pyLiveKML.KML.GeoCoordinates` objects.
         """
-        yield from self._coordinates
+        return self._coordinates
 
     @coordinates.setter
     def coordinates(self, value: Iterable[GeoCoordinates]):
-        self._coordinates.clear()
-        self._coordinates.extend(value)
-        if len(self._coordinates) < 3:
+        coordinates = tuple(value)
+        if len(coordinates) < 3:
             raise ValueError('There must be at least three points in the boundary')
+        self._coordinates = coordinates
         self.field_changed()
 
     def build_kml(self, root: etree.Element, with_children=True):
         if self._gx_altitude_offset is not None:
-            etree.SubElement(root, 'gx:altitudeOffset').text = f'{self._gx_altitude_offset:0.1f}'
+            etree.SubElement(root, _GX_ALTITUDE_OFFSET).text = f'{self._gx_altitude_offset:0.1f}'
         if self._extrude is not None:
-            etree.SubElement(root, 'extrude').text = str(int(self._extrude))
+            etree.SubElement(root, 'extrude').text = '1' if self._extrude else '0'
         if self._tessellate is not None:
-            etree.SubElement(root, 'tessellate').text = str(int(self._tessellate))
+            etree.SubElement(root, 'tessellate').text = '1' if self._tessellate else '0'
         if self._altitude_mode is not None:
             etree.SubElement(root, 'altitudeMode').text = self._altitude_mode.value
         if self._coordinates:
-            def build() -> str:
-                for c in self._coordinates:
-                    yield c.__str__()
-                yield self._coordinates[0].__str__()
-            etree.SubElement(root, 'coordinates').text = ' '.join(build())
+            # the ring is closed by repeating the first point
+            points = [c.__str__() for c in self._coordinates]
+            points.append(points[0])
+            etree.SubElement(root, 'coordinates').text = ' '.join(points)
 
     def __init__(
             self,
@@ -136,5 +138,4 @@ class LinearRing(Geometry):
         self._extrude = extrude
         self._tessellate = tessellate
         self._altitude_mode = altitude_mode
-        self._coordinates = list[GeoCoordinates]()
-        self._coordinates.extend(coordinates)
+        self._coordinates: tuple[GeoCoordinates, ...] = tuple(coordinates)
@@ -75,7 +75,7 @@ class ListStyle(SubStyle):
         if self._list_item_type is not None:
             etree.SubElement(root, 'listItemType').text = self._list_item_type.value
         if self._bg_color is not None:
-            etree.SubElement(root, 'bg_color').text = f'{self.bg_color:08x}'
+            etree.SubElement(root, 'bg_color').text = f'{self._bg_color:08x}'
         if self._item_icon_state is not None or self._item_icon_href is not None:
             item_icon = etree.SubElement(root, 'ItemIcon')
             if self._item_icon_state is not None:
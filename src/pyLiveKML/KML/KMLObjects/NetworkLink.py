@@ -32,9 +32,17 @@ class NetworkLink(Feature):
 
     @property
     def children(self) -> Iterator[ObjectChild]:
+        """Overridden from :attr:`pyLiveKML.KML.KMLObjects.Object.Object.children` to yield the children of a
+        :class:`~pyLiveKML.KML.KMLObjects.NetworkLink`, i.e. a :class:`~pyLiveKML.KML.KMLObjects.Link` instance, zero
+        or more :class:`~pyLiveKML.KML.KMLObjects.StyleSelector` instances, and any dependent
+        :class:`~pyLiveKML.KML.KMLObjects.SubStyle` instances.
+        """
         if self._link:
-            yield self._link
-        yield from self.styles
+            yield ObjectChild(parent=self, child=self._link)
+            yield from self._link.children
+        for s in self._styles:
+            yield ObjectChild(parent=self, child=s)
+            yield from s.children
 
     @property
     def is_open(self) -> Optional[bool]:
@@ -86,20 +94,20 @@ class NetworkLink(Feature):
         if self._name:
             etree.SubElement(root, 'name').text = self._name
         if self._visibility is not None:
-            etree.SubElement(root, 'visibility').text = str(int(self._visibility))
+            etree.SubElement(root, 'visibility').text = '1' if self._visibility else '0'
         if self._is_open is not None:
-            etree.SubElement(root, 'open').text = str(int(self._is_open))
+            etree.SubElement(root, 'open').text = '1' if self._is_open else '0'
         if self._description:
             etree.SubElement(root, 'description').text = self._description
         if self._refresh_visibility is not None:
-            etree.SubElement(root, 'refreshVisibility').text = str(int(self._refresh_visibility))
+            etree.SubElement(root, 'refreshVisibility').text = '1' if self._refresh_visibility else '0'
         if self._style_url:
             etree.SubElement(root, 'styleUrl').text = self._style_url
         if with_children:
             for s in self._styles:
-                root.append(s.construct_kml())
+                s.populate_kml(root)
             if self._link:
-                root.append(self._link.construct_kml())
+                self._link.populate_kml(root)
 
     def __init__(
             self,
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from typing import Optional, NamedTuple, Iterator
 from uuid import uuid4
 from lxml import etree
 
-from ..KML import State
+from ..KML import State, kml_nsmap
+
+
+# state groups for membership tests; a tuple scan compares by identity first, which is faster than chained == tests,
+# frozenset lookups (Enum.__hash__ is implemented in Python) or IntFlag masks
+_SELECTED_STATES = (State.CREATING, State.CREATED, State.CHANGING)
+_DELETE_STATES = (State.DELETE_CREATED, State.DELETE_CHANGED)
 
 
 class Object(ABC):
@@ -12,6 +19,10 @@ class Object(ABC):
     KML elements (anything with an :attr:`id` property) derive.
     """
 
+    # subclasses whose build_kml() has no side effects may set this to True, so that their KML is built once and
+    # copied on subsequent builds until a field of the object, or of one of its descendants, changes
+    _memoize_kml: bool = False
+
     @property
     @abstractmethod
     def kml_type(self) -> str:
@@ -37,7 +48,7 @@ class Object(ABC):
         """True if this :class:`~pyLiveKML.KML.KMLObjects.Object` has been created and is not scheduled for deletion,
          otherwise False.
         """
-        return (State.CREATING, State.CREATED, State.CHANGING).__contains__(self._state)
+        return self._state in _SELECTED_STATES
 
     @selected.setter
     def selected(self, value: bool):
@@ -70,10 +81,54 @@ class Object(ABC):
 
         :returns: The KML representation of the object as an etree.Element.
         """
-        root = etree.Element(_tag=self.kml_type, attrib={'id': str(self.id)})
+        if self._memoize_kml:
+            return deepcopy(self._memoized_kml())
+        root = etree.Element(_tag=self.kml_type, attrib={'id': self._id_str})
+        self.build_kml(root)
+        return root
+
+    def populate_kml(self, parent: etree.Element) -> etree.Element:
+        """Constructs this :class:`~pyLiveKML.KML.KMLObjects.Object`'s KML representation directly as a child of the
+        provided parent etree.Element, rather than as a free-standing element that must later be appended to it.
+
+        :param etree.Element parent: The XML element that will be appended to.
+        :returns: The KML representation of the object as an etree.Element.
+        """
+        if self._memoize_kml:
+            root = deepcopy(self._memoized_kml())
+            parent.append(root)
+            return root
+        root = etree.SubElement(parent, _tag=self.kml_type, attrib={'id': self._id_str})
         self.build_kml(root)
         return root
 
+    def _build_key(self) -> tuple:
+        # the field versions of this object and all of its descendants; any field change alters the key
+        return (self._version, *(c.child._build_key() for c in self.children))
+
+    def _memoized_kml(self) -> etree.Element:
+        # the cached KML representation, rebuilt only when the build key has changed; callers must copy it
+        key = self._build_key()
+        if self._kml_key != key:
+            self._kml = etree.Element(_tag=self.kml_type, attrib={'id': self._id_str})
+            self.build_kml(self._kml)
+            self._kml_key = key
+        return self._kml
+
+    def write_kml(self, xf: etree.xmlfile):
+        """Write this :class:`~pyLiveKML.KML.KMLObjects.Object`'s KML representation to an incremental etree.xmlfile
+        writer.
+
+        :param etree.xmlfile xf: The writer that will be written to.
+        """
+        # built under a scratch parent that declares the KML namespaces, so that any gx: elements share the one 'gx'
+        # prefix rather than each declaring a generated prefix of its own; detaching it from the parent then leaves
+        # only the declarations that the subtree actually uses
+        scratch = etree.Element('kml', nsmap=kml_nsmap)
+        root = self.populate_kml(scratch)
+        scratch.remove(root)
+        xf.write(root)
+
     def update_kml(self, parent: 'Object', update: etree.Element):
         """Retrieve a complete child <Create>, <Change> or <Delete> KML tag as a child of an <Update> tag.
         The type of child tag retrieved is dependent on the current state of this
@@ -87,7 +142,7 @@ class Object(ABC):
             self.create_kml(parent, update)
         elif self._state == State.CHANGING:
             self.change_kml(update)
-        elif self._state == State.DELETE_CREATED or self._state == State.DELETE_CHANGED:
+        elif self._state in _DELETE_STATES:
             self.delete_kml(update)
         self.update_generated()
 
@@ -99,9 +154,8 @@ class Object(ABC):
         :param etree.Element update: The etree.Element of the <Update> tag that will be appended to.
         """
         create = etree.Element('Create')
-        parent_element = etree.SubElement(create, _tag=parent.kml_type, attrib={'targetId': str(parent.id)})
-        item = self.construct_kml()
-        parent_element.append(item)
+        parent_element = etree.SubElement(create, _tag=parent.kml_type, attrib={'targetId': parent._id_str})
+        item = self.populate_kml(parent_element)
         update.append(create)
         return item
 
@@ -111,7 +165,7 @@ class Object(ABC):
         :param etree.Element update: The etree.Element of the <Update> tag that will be appended to.
         """
         change = etree.Element('Change')
-        item = etree.SubElement(change, _tag=self.kml_type, attrib={'targetId': str(self.id)})
+        item = etree.SubElement(change, _tag=self.kml_type, attrib={'targetId': self._id_str})
         self.build_kml(item, with_children=False)
         update.append(change)
 
@@ -121,7 +175,7 @@ class Object(ABC):
         :param etree.Element update: The etree.Element of the <Update> tag that will be appended to.
         """
         delete = etree.Element('Delete')
-        etree.SubElement(delete, _tag=self.kml_type, attrib={'targetId': str(self.id)})
+        etree.SubElement(delete, _tag=self.kml_type, attrib={'targetId': self._id_str})
         update.append(delete)
 
     def force_idle(self):
@@ -140,6 +194,7 @@ class Object(ABC):
         """Flag that a field or property of this :class:`~pyLiveKML.KML.KMLObjects.Object` has changed, and
         re-synchronization with GEP may be required.
         """
+        self._version += 1
         if self._state == State.CREATED:  # or self._state == State.IDLE:
             self._state = State.CHANGING
         elif self._state == State.DELETE_CREATED:
@@ -159,7 +214,7 @@ class Object(ABC):
         elif self._state == State.CHANGING:
             # if the object is changing, don't mess with its descendants - they are updated elsewhere if necessary
             self._state = State.CREATED
-        elif self._state == State.DELETE_CREATED or self._state == State.DELETE_CHANGED:
+        elif self._state in _DELETE_STATES:
             self._state = State.IDLE
 
     def select(self, value: bool, cascade: bool = False):
@@ -189,11 +244,15 @@ class Object(ABC):
                 c.child.force_idle()
 
     def __init__(self):
-        ABC.__init__(self)
         self._id: uuid4 = uuid4()
+        # the id never changes, so its string form is formatted once rather than on every build
+        self._id_str: str = str(self._id)
         self._selected: bool = False
         self._container: Optional[Object] = None
         self._state = State.IDLE
+        self._version: int = 0
+        self._kml: Optional[etree.Element] = None
+        self._kml_key: Optional[tuple] = None
 
     def __str__(self):
         return f'{self.kml_type}'
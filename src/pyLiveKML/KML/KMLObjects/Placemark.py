@@ -39,8 +39,8 @@ class Placemark(Feature):
         or more :class:`~pyLiveKML.KML.KMLObjects.StyleSelector` instances, and any dependent
         :class:`~pyLiveKML.KML.KMLObjects.SubStyle` instances.
         """
-        yield ObjectChild(parent=self, child=self.geometry)
-        yield from self.geometry.children
+        yield ObjectChild(parent=self, child=self._geometry)
+        yield from self._geometry.children
         for s in self._styles:
             yield ObjectChild(parent=self, child=s)
             yield from s.children
@@ -54,17 +54,17 @@ class Placemark(Feature):
 
     def build_kml(self, root: etree.Element, with_children=True):
         if self._name is not None:
-            etree.SubElement(root, 'name').text = self.name
+            etree.SubElement(root, 'name').text = self._name
         if self._visibility is not None:
-            etree.SubElement(root, 'visibility').text = str(int(self.visibility))
+            etree.SubElement(root, 'visibility').text = '1' if self._visibility else '0'
         if self._description is not None:
-            etree.SubElement(root, 'description').text = self.description
+            etree.SubElement(root, 'description').text = self._description
         if self._style_url is not None:
             etree.SubElement(root, 'styleUrl').text = self._style_url
         if with_children:
             for s in self._styles:
-                root.append(s.construct_kml())
-            root.append(self.geometry.construct_kml())
+                s.populate_kml(root)
+            self._geometry.populate_kml(root)
 
     def __init__(
             self,
@@ -74,7 +74,11 @@ class Placemark(Feature):
             inline_style: Optional[StyleSelector] = None,
             style_url: Optional[str] = None
     ):
-        Feature.__init__(self, name=name, visibility=visibility, style_url=style_url)
+        Feature.__init__(
+            self,
+            name=name,
+            visibility=visibility,
+            style_url=style_url,
+            styles=(inline_style, ) if inline_style else None
+        )
         self._geometry = geometry
-        if inline_style:
-            self._styles.append(inline_style)
@@ -65,11 +65,11 @@ class Point(Geometry):
         self.field_changed()
 
     def build_kml(self, root: etree.Element, with_children=True):
-        if self.extrude is not None:
-            etree.SubElement(root, 'visibility').text = str(int(self.extrude))
-        if self.altitude_mode is not None:
-            etree.SubElement(root, 'altitudeMode').text = self.altitude_mode.value
-        etree.SubElement(root, 'coordinates').text = self.coordinates.__str__()
+        if self._extrude is not None:
+            etree.SubElement(root, 'extrude').text = '1' if self._extrude else '0'
+        if self._altitude_mode is not None:
+            etree.SubElement(root, 'altitudeMode').text = self._altitude_mode.value
+        etree.SubElement(root, 'coordinates').text = self._coordinates.__str__()
 
     def __init__(
         self,
@@ -54,14 +54,14 @@ class PolyStyle(ColorStyle):
             self.field_changed()
 
     def build_kml(self, root: etree.Element, with_children=True):
-        if self.color is not None:
-            etree.SubElement(root, 'color').text = f'{self.color:08x}'
-        if self.color_mode is not None:
-            etree.SubElement(root, 'colorMode').text = self.color_mode.value
+        if self._color is not None:
+            etree.SubElement(root, 'color').text = f'{self._color:08x}'
+        if self._color_mode is not None:
+            etree.SubElement(root, 'colorMode').text = self._color_mode.value
         if self._fill is not None:
-            etree.SubElement(root, 'fill').text = str(int(self._fill))
+            etree.SubElement(root, 'fill').text = '1' if self._fill else '0'
         if self._outline is not None:
-            etree.SubElement(root, 'outline').text = str(int(self._outline))
+            etree.SubElement(root, 'outline').text = '1' if self._outline else '0'
 
     def __init__(
             self,
@@ -39,7 +39,7 @@ class Polygon(Geometry):
         :class:`~pyLiveKML.KML.KMLObjects.Polygon`, i.e. one or more :class:`~pyLiveKML.KML.KMLObjects.LinearRing`
         instances, being the :attr:`outer_boundary` and zero or more :attr:`inner_boundaries`.
         """
-        yield ObjectChild(parent=self, child=self.outer_boundary)
+        yield ObjectChild(parent=self, child=self._outer_boundary)
         for b in self._inner_boundaries:
             yield ObjectChild(parent=self, child=b)
 
@@ -57,13 +57,13 @@ class Polygon(Geometry):
             self.field_changed()
 
     @property
-    def inner_boundaries(self) -> Iterator[LinearRing]:
-        """A generator to retrieve the :class:`~pyLiveKML.KML.KMLObjects.LinearRing` objects that define cutouts within
-        the :attr:`outer_boundary`.
+    def inner_boundaries(self) -> tuple[LinearRing, ...]:
+        """The :class:`~pyLiveKML.KML.KMLObjects.LinearRing` objects that define cutouts within the
+        :attr:`outer_boundary`.
 
-        :returns: A generator of :class:`~pyLiveKML.KML.KMLObjects.LinearRing` objects.
+        :returns: A tuple of :class:`~pyLiveKML.KML.KMLObjects.LinearRing` objects.
         """
-        yield from self._inner_boundaries
+        return self._inner_boundaries
 
     @property
     def extrude(self) -> Optional[bool]:
@@ -122,18 +122,18 @@ class Polygon(Geometry):
 
     def build_kml(self, root: etree.Element, with_children=True):
         if self._extrude is not None:
-            etree.SubElement(root, 'extrude').text = str(int(self._extrude))
+            etree.SubElement(root, 'extrude').text = '1' if self._extrude else '0'
         if self._tessellate is not None:
-            etree.SubElement(root, 'tessellate').text = str(int(self._tessellate))
+            etree.SubElement(root, 'tessellate').text = '1' if self._tessellate else '0'
         if self._altitude_mode is not None:
             etree.SubElement(root, 'altitudeMode').text = self._altitude_mode.value
         if with_children:
             if self._outer_boundary:
-                etree.SubElement(root, 'outerBoundaryIs').append(self._outer_boundary.construct_kml())
+                self._outer_boundary.populate_kml(etree.SubElement(root, 'outerBoundaryIs'))
                 if self._outer_boundary._state == State.IDLE:
                     self._outer_boundary._state = State.CREATED
             for b in self._inner_boundaries:
-                etree.SubElement(root, 'innerBoundaryIs').append(b.construct_kml())
+                b.populate_kml(etree.SubElement(root, 'innerBoundaryIs'))
                 if b._state == State.IDLE:
                     b._state = State.CREATED
 
@@ -147,9 +147,7 @@ class Polygon(Geometry):
     ):
         Geometry.__init__(self)
         self._outer_boundary = outer_boundary
-        self._inner_boundaries = list[LinearRing]()
-        if inner_boundaries:
-            self._inner_boundaries.extend(inner_boundaries)
+        self._inner_boundaries: tuple[LinearRing, ...] = tuple(inner_boundaries) if inner_boundaries else ()
         self._extrude = extrude
         self._tessellate = tessellate
         self._altitude_mode = altitude_mode
@@ -95,17 +95,17 @@ class Style(StyleSelector):
     def build_kml(self, root: etree.Element, with_children=True):
         if with_children:
             if self._balloon_style is not None:
-                root.append(self._balloon_style.construct_kml())
+                self._balloon_style.populate_kml(root)
             if self._icon_style is not None:
-                root.append(self._icon_style.construct_kml())
+                self._icon_style.populate_kml(root)
             if self._label_style is not None:
-                root.append(self._label_style.construct_kml())
+                self._label_style.populate_kml(root)
             if self._line_style is not None:
-                root.append(self._line_style.construct_kml())
+                self._line_style.populate_kml(root)
             if self._list_style is not None:
-                root.append(self._list_style.construct_kml())
+                self._list_style.populate_kml(root)
             if self._poly_style is not None:
-                root.append(self._poly_style.construct_kml())
+                self._poly_style.populate_kml(root)
 
     def __init__(
             self,
@@ -106,14 +106,14 @@ class StyleMap(StyleSelector):
                 normal = etree.SubElement(root, 'Pair')
                 etree.SubElement(normal, 'key').text = 'normal'
                 if self._normal_style:
-                    normal.append(self._normal_style.construct_kml())
+                    self._normal_style.populate_kml(normal)
                 if self._normal_style_url:
                     etree.SubElement(normal, 'styleUrl').text = self._normal_style_url
             if self._highlight_style_url or self._highlight_style:
                 highlight = etree.SubElement(root, 'Pair')
                 etree.SubElement(highlight, 'key').text = 'highlight'
                 if self._highlight_style:
-                    highlight.append(self._highlight_style.construct_kml())
+                    self._highlight_style.populate_kml(highlight)
                 if self._highlight_style_url:
                     etree.SubElement(highlight, 'styleUrl').text = self._highlight_style_url
 
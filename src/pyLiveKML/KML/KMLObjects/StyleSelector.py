@@ -1,14 +1,14 @@
-from abc import ABC
-
 from .Object import Object
 
 
-class StyleSelector(Object, ABC):
+class StyleSelector(Object):
     """A KML 'StyleSelector', per https://developers.google.com/kml/documentation/kmlreference#styleselector. The
     :class:`~pyLiveKML.KML.KMLObjects.StyleSelector` class is the abstract base class for KML
     :class:`~pyLiveKML.KML.KMLObjects.Object` instances that represent display styles for
     :class:`~pyLiveKML.KML.KMLObjects.Feature` instances.
     """
+
+    _memoize_kml = True
+
     def __init__(self):
         Object.__init__(self)
-        ABC.__init__(self)
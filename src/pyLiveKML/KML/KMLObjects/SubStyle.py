@@ -1,9 +1,7 @@
-from abc import ABC
-
 from .Object import Object
 
 
-class SubStyle(Object, ABC):
+class SubStyle(Object):
     """A KML 'SubStyle', per https://developers.google.com/kml/documentation/kmlreference. Note that there is no
     description of the :class:`~pyLiveKML.KML.KMLObjects.SubStyle` class in the Google KML documentation, although it
     is included in the inheritance tree at the top of the page.  The :class:`~pyLiveKML.KML.KMLObjects.SubStyle` class
@@ -11,6 +9,7 @@ class SubStyle(Object, ABC):
     :class:`~pyLiveKML.KML.KMLObjects.Style` objects.
     """
 
+    _memoize_kml = True
+
     def __init__(self):
         Object.__init__(self)
-        ABC.__init__(self)
@@ -1,3 +1,6 @@
+from operator import attrgetter
+from typing import Optional
+
 from lxml import etree
 
 from .KML import UnitsEnum, Vec2Type
@@ -21,25 +24,37 @@ class Vec2:
     :var UnitsEnum y_units: The units type of the Vec2 object's y value. Defaults to 'fraction'.
     """
 
+    __slots__ = ('_attrib', 'vec_type', 'x', 'y', 'x_units', 'y_units')
+
     @property
     def xml(self) -> etree.Element:
         """An XML representation of this object.
         """
-        root = etree.Element(self.vec_type.value)
-        root.attrib['x'] = str(self.x)
-        root.attrib['y'] = str(self.y)
-        root.attrib['xunits'] = self.x_units.value
-        root.attrib['yunits'] = self.y_units.value
-        return root
+        # the attribute strings are only re-formatted after a field has changed; lxml copies the dict, so it is safe
+        # to share it between the generated elements
+        if self._attrib is None:
+            self._attrib = {
+                'x': str(self.x),
+                'y': str(self.y),
+                'xunits': self.x_units.value,
+                'yunits': self.y_units.value,
+            }
+        return etree.Element(self.vec_type.value, attrib=self._attrib)
+
+    _fields = attrgetter('vec_type', 'x', 'y', 'x_units', 'y_units')
 
     def __eq__(self, other: 'Vec2') -> bool:
-        return False if other is None else \
-            isinstance(other, Vec2) and self.name == other.name and self.x == other.x and self.y == other.y \
-            and self.x_units == other.x_units and self.y_units == other.y_units
+        return isinstance(other, Vec2) and Vec2._fields(self) == Vec2._fields(other)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+        # any change to a public field invalidates the cached XML attributes
+        if key[0] != '_':
+            object.__setattr__(self, '_attrib', None)
+
     def __init__(
             self,
             vec_type: Vec2Type = Vec2Type.HOTSPOT,
@@ -49,6 +64,7 @@ class Vec2:
             y_units: UnitsEnum = UnitsEnum.FRACTION
     ):
         super().__init__()
+        self._attrib: Optional[dict[str, str]] = None
         self.vec_type = vec_type
         self.x = x
         self.y = y
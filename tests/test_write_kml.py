@@ -0,0 +1,57 @@
+import io
+import unittest
+
+from lxml import etree
+
+from src.pyLiveKML.KML.GeoCoordinates import GeoCoordinates
+from src.pyLiveKML.KML.KML import write_kml, kml_tag
+from src.pyLiveKML.KML.KMLObjects.Document import Document
+from src.pyLiveKML.KML.KMLObjects.Folder import Folder
+from src.pyLiveKML.KML.KMLObjects.LineString import LineString
+from src.pyLiveKML.KML.KMLObjects.LineStyle import LineStyle
+from src.pyLiveKML.KML.KMLObjects.Placemark import Placemark
+from src.pyLiveKML.KML.KMLObjects.Style import Style
+
+
+class TestWriteKml(unittest.TestCase):
+    """Checks that the streamed output of :func:`~pyLiveKML.KML.KML.write_kml` matches the element tree built by
+    :func:`~pyLiveKML.KML.KML.kml_tag` and :func:`~pyLiveKML.KML.KMLObjects.Container.Container.construct_kml`.
+    """
+
+    def setUp(self):
+        line_style = LineStyle(width=2.0, color=0xff0000ff)
+        line_style.gx_outer_width = 1.0
+        line_style.gx_label_visibility = True
+        self.root = Folder(name='root', styles=[Style(line_style=line_style)])
+        document = Document(name='document')
+        self.root.append(document)
+        for i in range(3):
+            line = LineString(
+                coordinates=[GeoCoordinates(i, 1, 2), GeoCoordinates(i + 1, 2, 3)],
+                gx_altitude_offset=1.0,
+                gx_draw_order=i,
+            )
+            document.append(Placemark(line, name=f'placemark {i}', inline_style=Style(line_style=LineStyle(1.0))))
+
+    def test_matches_constructed_kml(self):
+        streamed = io.BytesIO()
+        write_kml(streamed, self.root)
+        kml = kml_tag()
+        kml.append(self.root.construct_kml(with_features=True))
+        constructed = etree.tostring(kml, xml_declaration=True, encoding='UTF-8')
+        self.assertEqual(
+            etree.tostring(etree.fromstring(streamed.getvalue()), method='c14n'),
+            etree.tostring(etree.fromstring(constructed), method='c14n'),
+        )
+
+    def test_gx_prefix_is_shared(self):
+        streamed = io.BytesIO()
+        write_kml(streamed, self.root)
+        text = streamed.getvalue()
+        self.assertNotIn(b'xmlns:ns0', text)
+        self.assertIn(b'<gx:altitudeOffset>', text)
+        self.assertIn(b'<gx:outerWidth>', text)
+
+
+if __name__ == '__main__':
+    unittest.main()